@@ -21,15 +21,20 @@ class OurFrame(bitgrid1_gui.MyFrame1):
         helpdialog = OurHelp(None)
         helpdialog.ShowModal()
 
-    #update the inputs
-    def UpdateInputs(self, event):
-        print("updating inputs")
-        programcode = self.cellHex.GetLineText(0)
+    #pack the input toggle buttons into the 4 bit LUT index
+    def GetInputValue(self):
         inputvalue = 0
         if self.inUp.GetValue():    inputvalue = inputvalue + 8
         if self.inLeft.GetValue():  inputvalue = inputvalue + 4
         if self.inRight.GetValue(): inputvalue = inputvalue + 2
         if self.inDown.GetValue():  inputvalue = inputvalue + 1
+        return inputvalue
+
+    #update the inputs
+    def UpdateInputs(self, event):
+        print("updating inputs")
+        programcode = self.cellHex.GetLineText(0)
+        inputvalue = self.GetInputValue()
         self.cellHex.SetSelection(inputvalue,inputvalue+1)
         self.cellHex.SetFocus()
         print("Input value %0.1x"%inputvalue)
@@ -44,11 +49,7 @@ class OurFrame(bitgrid1_gui.MyFrame1):
     #if the outputs are changed by the user... change the program to match
     def outChanged(self, event):
         print("user forced output changes, updating program")
-        inputvalue = 0
-        if self.inUp.GetValue():    inputvalue = inputvalue + 8
-        if self.inLeft.GetValue():  inputvalue = inputvalue + 4
-        if self.inRight.GetValue(): inputvalue = inputvalue + 2
-        if self.inDown.GetValue():  inputvalue = inputvalue + 1
+        inputvalue = self.GetInputValue()
         outputvalue = 0
         if self.outUp.GetValue():     outputvalue = outputvalue + 8
         if self.outLeft.GetValue():   outputvalue = outputvalue + 4